@@ -57,4 +57,7 @@ class Color(IntEnum):
         :param s: string to wrap
         :return: wrapped string
         """
-        return Theme.format_code(str(self.value)) + s + RESET_CODE
+        return _FORMAT_CODES[self] + s + RESET_CODE
+
+
+_FORMAT_CODES = {c: Theme.format_code(str(c.value)) for c in Color}
@@ -19,7 +19,7 @@ from dataclasses import dataclass, field
 from typing import override
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     """A CoH2 (pre-made) team with its members and stats."""
 
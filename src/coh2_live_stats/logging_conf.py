@@ -45,6 +45,8 @@ class LoggingConf:
     CONF_PATH = Path(getattr(sys, '_MEIPASS', str(Path(__file__).parent))).joinpath(
         '_logging.toml'
     )
+    # Log file sibling: ...\dist\CoH2LiveStats\lib (_MEIPASS) or ...\src
+    _LOG_ANCHOR = Path(getattr(sys, '_MEIPASS', str(Path(__file__).parents[1])))
 
     def __init__(self, logfile: Path | None = None, *, stdout: bool = False) -> None:
         """Initialize the custom logging configuration.
@@ -69,9 +71,7 @@ class LoggingConf:
         try:
             if logfile is None:
                 logfile = Path(self.log_conf['handlers']['file']['filename'])
-                logfile = Path(
-                    getattr(sys, '_MEIPASS', str(Path(__file__).parents[1]))
-                ).with_name(logfile.name)
+                logfile = self._LOG_ANCHOR.with_name(logfile.name)
             self.log_conf['handlers']['file']['filename'] = str(logfile)
         except KeyError as e:
             msg = f'Failed to patch handler filename in {self.CONF_PATH}'
@@ -181,16 +181,23 @@ class SimpleFormatter(Formatter):
 class DetailedFormatter(Formatter):
     """A formatter that puts the milliseconds before the timezone."""
 
+    # Second, date format and the date format parts around %f formatted for that second
+    _last_time: tuple[int, str, tuple[str, ...]] = (-1, '', ())
+
     @override
     def formatTime(self, record: LogRecord, datefmt: str | None = None) -> str:
-        ct = self.converter(record.created)
         if datefmt:
-            # Replace %f (only supported by datetime) with milliseconds
-            s = time.strftime(datefmt.replace('%f', f'{record.msecs:03.0f}'), ct)
-        else:
-            s = time.strftime(self.default_time_format, ct)
-            if self.default_msec_format:
-                s = self.default_msec_format % (s, record.msecs)
+            # Replace %f (only supported by datetime) with milliseconds. The rest only
+            # changes every second, so format it once per second.
+            sec, fmt, parts = self._last_time
+            if sec != int(record.created) or fmt != datefmt:
+                ct = self.converter(record.created)
+                parts = tuple(time.strftime(p, ct) for p in datefmt.split('%f'))
+                self._last_time = (int(record.created), datefmt, parts)
+            return f'{record.msecs:03.0f}'.join(parts)
+        s = time.strftime(self.default_time_format, self.converter(record.created))
+        if self.default_msec_format:
+            s = self.default_msec_format % (s, record.msecs)
         return s
 
 
@@ -210,4 +217,5 @@ class HiddenOutputFilter(Filter):
 
     @override
     def filter(self, record: LogRecord) -> bool | LogRecord:
-        return not getattr(record, self.KEY_EXTRA_HIDE, False)
+        # Extra data is stored in the record's __dict__
+        return not record.__dict__.get(self.KEY_EXTRA_HIDE, False)
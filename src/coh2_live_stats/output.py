@@ -17,8 +17,9 @@
 
 import asyncio
 import logging
+import sys
 from functools import partial
-from typing import Any, Final, Protocol, cast, override
+from typing import Any, Final, Protocol, override
 
 from prettytable import PrettyTable
 from prettytable.colortable import ColorTable, Theme
@@ -51,8 +52,12 @@ class _TableTypeError(Exception):
 
 LOG = logging.getLogger('coh2_live_stats')
 
+# Erase screen, move cursor home and erase scrollback
+_CLEAR_SCREEN = '\033[2J\033[H\033[3J'
+# Spinner frames: cursor back one column, then the next character
+_PROGRESS_FRAMES = tuple(f'\033[D{c}' for c in '/—\\|')
+
 
-# ruff: noqa: T201
 class Output:
     """Provides an interface for outputting ``Match`` data.
 
@@ -69,6 +74,7 @@ class Output:
         """
         self.settings = settings
         self.table = self._create_output_table()
+        self._column_index: dict[str, int] = {}
         self._set_formatters()
         LOG.info('Initialized %s', cls_name(self))
 
@@ -105,6 +111,7 @@ class Output:
             )
         ]
         self.table.field_names = [label for label, _ in visible_columns]
+        self._update_column_index()
 
         for label, align in visible_columns:
             self.table.align[label] = align
@@ -126,9 +133,12 @@ class Output:
         if col.visible:
             row[self.get_column_index(col)] = val
 
+    def _update_column_index(self) -> None:
+        self._column_index = {f: i for i, f in enumerate(self.table.field_names)}
+
     def get_column_index(self, col: Any) -> int:  # noqa: ANN401
         """Return the index into ``PrettyTable`` field names for a given column."""
-        return cast(int, self.table.field_names.index(col.label))
+        return self._column_index[col.label]
 
     def print_match(self, players: list[Player]) -> None:
         """Print a match.
@@ -138,14 +148,15 @@ class Output:
         self._clear()
 
         if not players:
-            print(Output.ERR_NO_MATCH)
+            Output._write_screen(Output.ERR_NO_MATCH + '\n')
             return
 
         self.init_table(players)
         table = self.table_string()
         if table:
-            print(table)
+            Output._write_screen(table + '\n')
         else:
+            Output._write_screen('')
             LOG.warning(Output.ERR_NO_COLUMNS)
 
     def table_string(self) -> str:
@@ -201,6 +212,7 @@ class Output:
             if col.visible:
                 LOG.info('Deleting column %r', col.label)
                 self.table.del_column(col.label)
+        self._update_column_index()
 
     def _create_player_row(self, party: Party, player: Player) -> list[SupportsStr]:
         cols = self.settings.table.columns
@@ -325,21 +337,32 @@ class Output:
         return avg_row
 
     def _clear(self) -> None:
-        print('\033[2J\033[H\033[3J', end='', flush=True)
         self.table.clear()
+        self._column_index.clear()
+
+    @staticmethod
+    def _write_screen(s: str) -> None:
+        # Clear and redraw in a single write: no blank screen while the table is
+        # built and no partial frames on slow consoles
+        sys.stdout.write(_CLEAR_SCREEN + s)
+        sys.stdout.flush()
 
     @staticmethod
     async def progress_start() -> None:
         """Print an indeterminate progress bar."""
+        out = sys.stdout
         while True:
-            for c in '/—\\|':
-                print(f'\033[D{c}', end='', flush=True)
+            for frame in _PROGRESS_FRAMES:
+                # One write per frame, flushed so the frame shows up right away
+                out.write(frame)
+                out.flush()
                 await asyncio.sleep(0.25)
 
     @staticmethod
     def progress_stop() -> None:
         """Remove leftovers from progress bar."""
-        print('\033[D\033[K', end='', flush=True)
+        sys.stdout.write('\033[D\033[K')
+        sys.stdout.flush()
 
     def _format_string(self, v: TableType) -> str | None:
         if isinstance(v, str):
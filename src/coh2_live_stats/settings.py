@@ -17,9 +17,12 @@
 
 import logging
 import sys
+from collections.abc import Iterator
 from contextlib import suppress
 from enum import Enum
-from os.path import expandvars
+from operator import attrgetter
+from os import scandir
+from os.path import expandvars, normcase
 from pathlib import Path
 from tomllib import TOMLDecodeError, load
 from typing import (
@@ -66,12 +69,13 @@ CONFIG_PATHS = ['%USERPROFILE%', str(Path(getattr(sys, '_MEIPASS', __file__)).pa
 CONFIG_NAMES = [
     f'{p}{b}.toml' for b in ['coh2livestats', 'coh2_live_stats'] for p in ['_', '.', '']
 ]
-CONFIG_FILES = [
-    Path(expandvars(p)).joinpath(n) for p in CONFIG_PATHS for n in CONFIG_NAMES
-]
+_CONFIG_DIRS = tuple(Path(expandvars(p)) for p in CONFIG_PATHS)
 
 CONFIG_FILE_DEV: Path = Path(__file__).with_name(CONFIG_NAMES[0])
 
+# Bundled resources: ...\dist\CoH2LiveStats\lib\res or ...\src\coh2_live_stats\res
+_RES_DIR = Path(getattr(sys, '_MEIPASS', str(Path(__file__).parent))).joinpath('res')
+
 Align = Literal['l', 'c', 'r']
 Border = Literal['full', 'inner', 'none']
 Sound = Literal['horn_subtle', 'horn', 'horn_epic']
@@ -79,14 +83,18 @@ Sound = Literal['horn_subtle', 'horn', 'horn_epic']
 
 def resolve_sound_name(s: Sound) -> Path:
     """Return the ``Path`` for the given ``Sound``."""
-    return Path(getattr(sys, '_MEIPASS', str(Path(__file__).parent))).joinpath(
-        'res', f'{s}.wav'
-    )
+    return _RES_DIR.joinpath(f'{s}.wav')
+
+
+# Color names as written in configs (lowercase) or as defined
+_COLORS = {n: c for c in Color for n in (c.name.lower(), c.name)}
 
 
 def _validate_color(v: str) -> Color:
-    with suppress(KeyError):
-        return Color[v.upper()]
+    if (c := _COLORS.get(v)) is None:
+        c = _COLORS.get(v.upper())
+    if c is not None:
+        return c
     msg = f'not a color: {v!r}. Valid colors are: {', '.join([c.name for c in Color])}.'
     raise ValueError(msg)
 
@@ -144,6 +152,10 @@ else:
     )
 
 
+# Faction color getters for _TableColorsFaction
+_FACTION_COLORS = {f: attrgetter(f.name.lower()) for f in Faction}
+
+
 class _TableColors(BaseModel):
     border: _CT = Field(Color.BRIGHT_BLACK, description='Output table border color')
     label: _CT = Field(Color.BRIGHT_BLACK, description='Output table header color')
@@ -155,7 +167,7 @@ class _TableColors(BaseModel):
     )
 
     def get_faction_color(self, f: Faction) -> Color:
-        return cast(Color, getattr(self.faction, f.name.lower()))
+        return cast(Color, _FACTION_COLORS[f](self.faction))
 
 
 class _Col(NamedTuple):
@@ -357,9 +369,24 @@ class TomlSettings(Settings):
     ) -> tuple[PydanticBaseSettingsSource, ...]:
         return (TomlConfigSettingsSource(settings_cls),)
 
+    @staticmethod
+    def _config_candidates() -> Iterator[Path]:
+        # Most candidates don't exist: list each config dir once instead of
+        # probing every name
+        for d in _CONFIG_DIRS:
+            try:
+                with scandir(d) as it:
+                    files = {normcase(e.name): e.name for e in it if e.is_file()}
+            except OSError:
+                continue
+            for n in CONFIG_NAMES:
+                if (name := files.get(normcase(n))) is not None:
+                    yield d.joinpath(name)
+
     @staticmethod
     def _first_valid_config() -> Path | None:
-        for c in CONFIG_FILES:
+        for c in TomlSettings._config_candidates():
+            # Might be gone since listing its directory
             with suppress(FileNotFoundError), c.open('rb') as f:
                 LOG.info('Found TOML config: %s', c)
                 try:
@@ -17,7 +17,6 @@
 
 import sys
 from contextlib import suppress
-from inspect import isclass
 from pathlib import Path
 
 if sys.platform == 'win32':
@@ -30,7 +29,7 @@ def cls_name(obj: type | object) -> str:
     :param obj: class or instance
     :return: class name
     """
-    return obj.__name__ if isclass(obj) else type(obj).__name__
+    return obj.__name__ if isinstance(obj, type) else type(obj).__name__
 
 
 def cls_name_parent(obj: type | object) -> str | None:
@@ -39,15 +38,12 @@ def cls_name_parent(obj: type | object) -> str | None:
     :param obj: class or instance
     :return: class name
     """
-    return obj.mro()[1].__name__ if isclass(obj) else obj.__class__.mro()[1].__name__
+    return (obj if isinstance(obj, type) else type(obj)).__mro__[1].__name__
 
 
 def ratio(x: float, total: float) -> float | None:
     """X relative to total."""
-    try:
-        return x / total
-    except ZeroDivisionError:
-        return None
+    return x / total if total else None
 
 
 def stop_sound() -> None:
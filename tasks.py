@@ -15,16 +15,20 @@
 
 """A build script based on PyInvoke."""
 
+import asyncio
 import json
 import logging
 import os
+import subprocess  # noqa: S404
 import sys
 from collections.abc import Callable
+from hashlib import sha256
+from importlib.metadata import Distribution, PackageNotFoundError, distribution
 from pathlib import Path
 from shutil import rmtree
 from typing import Any, Final
 
-from invoke import Collection, Context, Result, task
+from invoke import Collection, Context, Exit, Result, task
 
 # Conditional imports and mypy - see: https://github.com/python/mypy/issues/1297
 
@@ -61,8 +65,6 @@ else:
     pyinstaller_setup = _pyinstaller_setup
 
 
-Package = dict[str, str]
-
 _VERSION_LEN: Final[int] = 3
 
 _pkg = 'coh2_live_stats'
@@ -72,8 +74,16 @@ _ruff_cmd = [*_pycmd, 'ruff', 'check', '.']
 _mypy_cmd = [*_pycmd, 'mypy', 'src', 'tests', 'scripts', 'tasks.py']
 _pytest_cmd = [*_pycmd, 'pytest', '--verbose', '--no-header', '--no-summary', '--tb=no']
 
-_gen_dirs = [Path(__file__).with_name(n) for n in ('dist', 'dist_bundle', 'build')]
+_gen_dirs = tuple(Path(__file__).with_name(n) for n in ('dist', 'dist_bundle', 'build'))
 _dist_dir = _gen_dirs[0]
+_cache_dir = Path(__file__).with_name('.invoke-cache')
+
+_venv = Path(__file__).with_name('venv')
+_activate_cmd: Final[str] = (
+    str(_venv.joinpath('Scripts', 'activate.bat'))
+    if os.name == 'nt'
+    else f'. {_venv.joinpath('bin', 'activate')}'
+)
 
 _logging = None
 if LoggingConf is not None:
@@ -97,13 +107,34 @@ def _run(c: Context, *args: str, **kwargs: Any) -> Result | None:  # noqa: ANN40
     return c.run(' '.join(args), **kwargs)
 
 
-@task
-def _run_check(c: Context, *cmd: str) -> bool:
-    res = _run(c, *cmd, echo=True, hide=False, warn=True)
-    if res is None:
-        msg = f'Failed to run check: {' '.join(cmd)!r}'
-        raise RuntimeError(msg)
-    return res.return_code == 0
+def _exec(*args: str, echo: bool = False, hide: bool = False) -> bool:
+    # Run without a shell: no extra process, no quoting of the arguments
+    if echo:
+        LOG.info(' '.join(args))
+    stdout = subprocess.DEVNULL if hide else None
+    return subprocess.run(args, stdout=stdout, check=False).returncode == 0  # noqa: S603
+
+
+def _run_check(*cmd: str) -> bool:
+    return _exec(*cmd, echo=True)
+
+
+def _run_checks_concurrently(*cmds: list[str]) -> list[bool]:
+    # For independent checks: output is captured and logged per command in order
+    async def run(cmd: list[str]) -> tuple[bool, str]:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+        )
+        out, _ = await proc.communicate()
+        return proc.returncode == 0, out.decode(errors='replace')
+
+    async def run_all() -> list[tuple[bool, str]]:
+        return await asyncio.gather(*map(run, cmds))
+
+    results = asyncio.run(run_all())
+    for cmd, (_, out) in zip(cmds, results, strict=True):
+        LOG.info('%s\n%s', ' '.join(cmd), out.rstrip())
+    return [success for success, _ in results]
 
 
 def _success(res: Result | None) -> bool:
@@ -112,50 +143,84 @@ def _success(res: Result | None) -> bool:
 
 @task
 def _activate(c: Context) -> bool:
-    venv = Path(__file__).with_name('venv')
-    cmd = (
-        str(venv.joinpath('Scripts', 'activate.bat'))
-        if os.name == 'nt'
-        else f'. {venv.joinpath('bin', 'activate')}'
-    )
-    return _success(c.run(cmd))
+    return _success(c.run(_activate_cmd))
 
 
-def _is_editable(p: Package) -> bool:
-    return p.get('editable_project_location') is not None
+def _is_editable(p: Distribution) -> bool:
+    # PEP 660/610: editable installs record {"dir_info": {"editable": true}}
+    direct_url = p.read_text('direct_url.json')
+    if direct_url is None:
+        return False
+    return bool(json.loads(direct_url).get('dir_info', {}).get('editable', False))
 
 
-@task(pre=[_activate], help={'name': 'Name of the package to get.'})
-def _get_pkg(c: Context, name: str) -> Package | None:
-    """Return the given package from pip."""
-    res = _run(c, *_pipcmd, 'list', '--format json')
-    packages: list[Package] = []
-    if res is not None:
-        packages = list(filter(lambda p: p['name'] == name, json.loads(res.stdout)))
-        if len(packages) > 1:
-            msg = f'Multiple packages {name!r} detected.'
-            raise ValueError(msg)
-    return packages[0] if packages else None
+def _get_pkg(name: str) -> Distribution | None:
+    """Return the given package if installed."""
+    # Same environment pip installs into: pip runs with sys.executable as well
+    try:
+        return distribution(name)
+    except PackageNotFoundError:
+        return None
 
 
 @task(pre=[_activate])
-def _install(c: Context) -> bool:
-    wheels = list(_dist_dir.glob(f'{_pkg}-*.whl'))
-    if wheels:
-        wheels.sort(reverse=True)
-        return _success(
-            _run(c, *_pipcmd, 'install', str(_dist_dir.joinpath(wheels[0])))
-        )
+def _install(_: Context) -> bool:
+    wheel = max(_dist_dir.glob(f'{_pkg}-*.whl'), default=None)
+    if wheel is not None:
+        return _exec(*_pipcmd, 'install', str(wheel), hide=True)
     return False
 
 
 @task(_activate)
-def _install_editable(c: Context, *, force: bool = False, dev: bool = False) -> bool:
+def _install_editable(_: Context, *, force: bool = False, dev: bool = False) -> bool:
     cmd = [*_pipcmd, 'install']
     if force:
         cmd += ['--force-reinstall']
-    cmd += ['-e .[build,dev]'] if dev else ['-e .']
-    return _success(_run(c, *cmd, hide=False))
+    cmd += ['-e', '.[build,dev]' if dev else '.']
+    return _exec(*cmd)
+
+
+def _check_inputs() -> list[Path]:
+    # Every file the checks may read, including test resources: tracked and new
+    # (not ignored) files as listed by git, or all files outside of git
+    root = Path(__file__).parent
+    dirs = ('src', 'tests', 'scripts')
+    git_cmd = ['git', 'ls-files', '-z', '--cached', '--others', '--exclude-standard']
+    try:
+        res = subprocess.run(  # noqa: S603
+            [*git_cmd, *dirs], cwd=root, capture_output=True, check=False
+        )
+    except OSError:
+        res = None
+    if res is not None and res.returncode == 0:
+        names = {n for n in res.stdout.decode().split('\0') if n}
+        tree = sorted(p for n in names if (p := root.joinpath(n)).is_file())
+    else:
+        tree = sorted(
+            f
+            for d in dirs
+            for f in root.joinpath(d).rglob('*')
+            if f.is_file() and '__pycache__' not in f.parts
+        )
+    return [root.joinpath('pyproject.toml'), root.joinpath('tasks.py'), *tree]
+
+
+def _digest(files: list[Path]) -> str:
+    h = sha256()
+    for f in files:
+        h.update(f.as_posix().encode())
+        h.update(f.read_bytes())
+    return h.hexdigest()
+
+
+def _stamp_matches(key: str, digest: str) -> bool:
+    stamp = _cache_dir.joinpath(f'{key}.sha256')
+    return stamp.is_file() and stamp.read_text(encoding='utf-8') == digest
+
+
+def _write_stamp(key: str, digest: str) -> None:
+    _cache_dir.mkdir(exist_ok=True)
+    _cache_dir.joinpath(f'{key}.sha256').write_text(digest, encoding='utf-8')
 
 
 def _clean() -> bool:
@@ -168,18 +233,28 @@ def _clean() -> bool:
     return True
 
 
-@task(pre=[_activate], post=[_stop_logging])
-def check(c: Context) -> bool:
+@task(
+    pre=[_activate],
+    post=[_stop_logging],
+    help={'force': 'Run checks even if nothing changed since they last passed.'},
+)
+def check(_: Context, *, force: bool = False) -> bool:
     """Run checks (ruff, mypy, pytest)."""
-    if not _run_check(c, *_ruff_cmd):
+    digest = _digest(_check_inputs())
+    if not force and _stamp_matches('check', digest):
+        LOG.info('Nothing changed since checks last passed.')
+        return True
+    ruff_ok, mypy_ok = _run_checks_concurrently(_ruff_cmd, _mypy_cmd)
+    if not ruff_ok:
         LOG.error('Ruff found errors.')
         return False
-    if not _run_check(c, *_mypy_cmd):
+    if not mypy_ok:
         LOG.error('Mypy found errors.')
         return False
-    if not _run_check(c, *_pytest_cmd):
+    if not _run_check(*_pytest_cmd):
         LOG.error('Running tests failed. Run pytest for more info.')
         return False
+    _write_stamp('check', digest)
     return True
 
 
@@ -200,7 +275,9 @@ def build(c: Context, *, clean: bool = False) -> None:
     if settings_generator is not None:
         settings_generator.write_default()
 
-    _run(c, *_pycmd, 'build', hide=False)
+    if not _exec(*_pycmd, 'build'):
+        LOG.error('Building distributions failed.')
+        raise Exit(code=1)
 
     if pyinstaller_setup is not None:
         pyinstaller_setup.bundle()
@@ -221,7 +298,7 @@ def install(c: Context, *, normal_mode: bool = False, dev: bool = False) -> bool
         LOG.info('Installing %s in non-editable mode...', _pkg)
         installed = _install(c)
     else:
-        pkg = _get_pkg(c, _pkg)
+        pkg = _get_pkg(_pkg)
         if pkg is None:
             LOG.info('Installing %s in editable mode...', _pkg)
             installed = _install_editable(c, force=False, dev=dev)
@@ -251,7 +328,7 @@ def publish(c: Context) -> None:
         str(next(Path(_dist_dir).glob(f'{base}*.whl'))),
     ]
 
-    if not _success(_run(c, *_pycmd, 'twine', 'check', *dist_files)):
+    if not _exec(*_pycmd, 'twine', 'check', *dist_files, hide=True):
         LOG.error('Twine failed to check distribution files.')
         return
 
@@ -13,7 +13,8 @@
 #  You should have received a copy of the GNU General Public License along with
 #  CoH2LiveStats. If not, see <https://www.gnu.org/licenses/>.
 
-from random import choice, randint, sample
+from dataclasses import fields, is_dataclass, replace
+from random import choice, getrandbits, randint, sample
 from typing import Final
 
 import pytest
@@ -22,12 +23,15 @@ from coh2_live_stats.data.countries import countries
 from coh2_live_stats.data.faction import Faction
 from coh2_live_stats.data.player import Player
 from coh2_live_stats.data.team import Team
+from coh2_live_stats.settings import Settings
 
 MIN_XP: Final[int] = 0
 MAX_XP: Final[int] = 18785964
 MIN_XP_LEVEL: Final[int] = 1
 MAX_XP_LEVEL: Final[int] = 300
 
+_COUNTRIES: Final[tuple[str, ...]] = tuple(countries)
+
 
 @pytest.fixture
 def _equality(monkeypatch: MonkeyPatch) -> None:
@@ -38,14 +42,21 @@ def _equality(monkeypatch: MonkeyPatch) -> None:
     """
 
     def mock_eq(o1: object, o2: object) -> bool:
-        if type(o1) is type(o2):
-            return o1.__dict__ == o2.__dict__
+        if type(o1) is type(o2) and is_dataclass(o1):
+            # Not __dict__: slotted dataclasses don't have one
+            return all(getattr(o1, f.name) == getattr(o2, f.name) for f in fields(o1))
         return NotImplemented
 
     monkeypatch.setattr(Player, '__eq__', mock_eq)
     monkeypatch.setattr(Team, '__eq__', mock_eq)
 
 
+@pytest.fixture(scope='session')
+def base_settings() -> Settings:
+    """Default settings shared by all tests: copy before modifying."""
+    return Settings()
+
+
 @pytest.fixture(scope='session')
 def players1() -> list[Player]:
     return [
@@ -74,19 +85,26 @@ def players2() -> list[Player]:
     ]
 
 
+def copy_players(players: list[Player]) -> list[Player]:
+    """Return copies of the given players that can be modified independently."""
+    return [
+        replace(p, teams=[replace(t, members=list(t.members)) for t in p.teams])
+        for p in players
+    ]
+
+
 def random_steam_id_64() -> int:
     """Return a random SteamID64 identifier for individuals.
 
     See: `Valve Developer Wiki <https://developer.valvesoftware.com/wiki/SteamID>`_.
     """
-    z = randint(0, 2147483648 - 1)
-    v = 0x0110000100000000
-    y = randint(0, 1)
-    return z * 2 + v + y
+    # Account number Z (31 bits) and authentication server Y (1 bit) as Z * 2 + Y
+    # are 32 uniformly random bits: draw them at once
+    return 0x0110000100000000 + getrandbits(32)
 
 
 def random_country() -> str:
-    return choice(list(countries))
+    return choice(_COUNTRIES)
 
 
 def random_leaderboard_region() -> int:
@@ -102,8 +120,9 @@ def random_xp() -> int:
 
 
 def random_rank(rank_total: int) -> int:
-    if rank_total > 0:
-        choice([-1, randint(1, rank_total)])
+    # Unranked with a chance of 1/2
+    if rank_total > 0 and randint(0, 1):
+        return randint(1, rank_total)
     return -1
 
 
@@ -15,7 +15,7 @@
 
 import asyncio
 from asyncio import Queue
-from collections.abc import AsyncGenerator, Generator, Iterable
+from collections.abc import Generator, Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -24,7 +24,7 @@ import pytest
 import pytest_asyncio
 from coh2_live_stats.__main__ import LogFileEventHandler, LogInfo
 from coh2_live_stats.data.player import Player
-from watchdog.observers import Observer
+from watchdog.events import FileModifiedEvent
 
 
 @pytest.fixture(scope='module')
@@ -39,17 +39,18 @@ def logfile() -> Generator[Path, Any, None]:
 
 
 @pytest_asyncio.fixture(scope='module')
-async def queue(logfile: Path) -> AsyncGenerator[Queue[LogInfo], Any]:  # noqa: RUF029 (need loop)
-    queue: Queue[LogInfo] = Queue()
-    observer = Observer()
-    observer.schedule(
-        LogFileEventHandler(asyncio.get_running_loop(), queue, logfile),
-        str(logfile.parent),
-    )  # type: ignore[no-untyped-call]
-    observer.start()  # type: ignore[no-untyped-call]
-    yield queue
-    observer.stop()  # type: ignore[no-untyped-call]
-    observer.join()
+async def handler(logfile: Path) -> LogFileEventHandler:  # noqa: RUF029 (need loop)
+    # Driven directly by the tests: no need for a watchdog observer thread
+    return LogFileEventHandler(asyncio.get_running_loop(), Queue(), logfile)
+
+
+@pytest.fixture(scope='module')
+def queue(handler: LogFileEventHandler) -> Queue[LogInfo]:
+    return handler.queue
+
+
+def _notify(handler: LogFileEventHandler) -> None:
+    handler.on_modified(FileModifiedEvent(str(handler.logfile)))
 
 
 @pytest.fixture
@@ -59,29 +60,31 @@ def now() -> str:
 
 
 def log_match(
-    logfile: Path, now: str, players: Iterable[Player], mode: str = 'w'
+    handler: LogFileEventHandler, now: str, players: Iterable[Player], mode: str = 'w'
 ) -> None:
-    log = (
+    header = (
         f'{now}   GAME -- Scenario: DATA:'
         'scenarios\\mp\\8p_redball_express\\8p_redball_express\n'
         f'{now}   GAME -- Win Condition Qualified Name: '
         '00000000000000000000000000000000:16123440\n'
         f'{now}   GAME -- Win Condition Name: victory_point\n'
     )
-    for i, p in enumerate(players):
-        log += (
-            f'{now}   GAME -- Human Player: '
-            f'{i} {p.name} {p.relic_id} {p.team_id} {p.faction.key_log}\n'
-        )
-    with logfile.open(mode=mode) as f:
-        f.write(log)
+    log = header + ''.join(
+        f'{now}   GAME -- Human Player: '
+        f'{i} {p.name} {p.relic_id} {p.team_id} {p.faction.key_log}\n'
+        for i, p in enumerate(players)
+    )
+    with handler.logfile.open(mode=f'{mode}b') as f:
+        f.write(log.encode('utf-8'))
+    _notify(handler)
 
 
 @pytest.fixture
-def _log_playing(logfile: Path, now: str) -> None:
+def _log_playing(handler: LogFileEventHandler, now: str) -> None:
     log = f'{now}   Party::SetStatus - S_PLAYING'
-    with logfile.open(mode='a') as f:
-        f.write(log)
+    with handler.logfile.open(mode='ab') as f:
+        f.write(log.encode('utf-8'))
+    _notify(handler)
 
 
 def test_initial_parse(queue: Queue[LogInfo]) -> None:
@@ -98,9 +101,12 @@ async def test_initial_parse_empty(queue: Queue[LogInfo]) -> None:
 @pytest.mark.asyncio(scope='module')
 @pytest.mark.usefixtures('_equality')
 async def test_parse_new_match(
-    queue: Queue[LogInfo], logfile: Path, now: str, players1: list[Player]
+    queue: Queue[LogInfo],
+    handler: LogFileEventHandler,
+    now: str,
+    players1: list[Player],
 ) -> None:
-    log_match(logfile, now, players1, mode='a')
+    log_match(handler, now, players1, mode='a')
     log_info: LogInfo = await queue.get()
     queue.task_done()
     assert log_info == LogInfo(players1, is_new_match=True, is_multiplayer_match=False)
@@ -109,9 +115,12 @@ async def test_parse_new_match(
 @pytest.mark.asyncio(scope='module')
 @pytest.mark.usefixtures('_equality')
 async def test_parse_next_match(
-    queue: Queue[LogInfo], logfile: Path, now: str, players2: list[Player]
+    queue: Queue[LogInfo],
+    handler: LogFileEventHandler,
+    now: str,
+    players2: list[Player],
 ) -> None:
-    log_match(logfile, now, players2, mode='a')
+    log_match(handler, now, players2, mode='a')
     log_info: LogInfo = await queue.get()
     queue.task_done()
     assert log_info == LogInfo(players2, is_new_match=True, is_multiplayer_match=False)
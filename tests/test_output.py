@@ -16,7 +16,6 @@
 import operator
 import re
 from collections.abc import Callable
-from copy import deepcopy
 from functools import partial
 from random import randint
 from typing import Any, Final
@@ -34,6 +33,7 @@ from coh2_live_stats.settings import Settings
 from scripts.script_util import flip
 
 from tests.conftest import (
+    copy_players,
     random_country,
     random_highest_rank,
     random_rank,
@@ -44,6 +44,8 @@ from tests.conftest import (
 )
 
 COLUMN_NAMES: Final[list[str]] = list(Settings().table.columns.model_fields)
+_NUM_COLS: Final[int] = len(COLUMN_NAMES)
+_ALL_VISIBLE: Final[int] = pow(2, _NUM_COLS) - 1
 
 
 # [@-Z] -> 0x40-0x5a + [\\-_] -> 0x5c-0x5f - without CSI 0x5b ([)
@@ -54,21 +56,22 @@ RE_ESCAPE: Final[re.Pattern[str]] = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*
 """Regex ANSI escape sequences."""
 
 
-RE_CTRL_CHAR: Final[re.Pattern[str]] = re.compile(r'[\a\b\f\n\r\t\v]')
-"""Regex python control characters."""
+CTRL_CHAR_TABLE: Final[dict[int, int | None]] = str.maketrans('', '', '\a\b\f\n\r\t\v')
+"""Translation table deleting python control characters."""
 
 
 def _strip(s: str) -> str:
-    return RE_ESCAPE.sub('', s)
+    # Uncolored output has nothing to strip: skip the regex
+    return RE_ESCAPE.sub('', s) if '\x1b' in s else s
 
 
 def _strip_cap(s: str) -> str:
-    return RE_CTRL_CHAR.sub('', _strip(s))
+    return _strip(s).translate(CTRL_CHAR_TABLE)
 
 
 @pytest.fixture(scope='module')
 def players_output(players1: list[Player]) -> list[Player]:
-    players = deepcopy(players1)
+    players = copy_players(players1)
     for p in players:
         p.steam_profile = f'/steam/{random_steam_id_64()}'
         p.prestige = xp_level_from_xp(random_xp())
@@ -101,8 +104,8 @@ def players_output(players1: list[Player]) -> list[Player]:
 
 
 @pytest.fixture(scope='module')
-def out(players_output: list[Player]) -> Output:
-    o = Output(_get_settings())
+def out(base_settings: Settings, players_output: list[Player]) -> Output:
+    o = Output(_get_settings(base_settings))
     o.init_table(players_output)
     return o
 
@@ -111,21 +114,24 @@ def out(players_output: list[Player]) -> Output:
     scope='module',
     params=[
         0,  # no visible columns
-        pow(2, len(Settings().table.columns.model_fields)) - 1,  # all columns visible
+        _ALL_VISIBLE,  # all columns visible
     ]
     # every column alone
-    + [pow(2, i) for i in range(len(Settings().table.columns.model_fields))],
+    + [pow(2, i) for i in range(_NUM_COLS)],
 )
-def out_v(request: FixtureRequest, players_output: list[Player]) -> Output:
-    o = Output(_get_settings(request.param))
+def out_v(
+    request: FixtureRequest, base_settings: Settings, players_output: list[Player]
+) -> Output:
+    o = Output(_get_settings(base_settings, request.param))
     o.init_table(players_output)
     return o
 
 
-def _get_settings(visibility_flags: int | None = None) -> Settings:
-    settings = Settings()
+def _get_settings(base: Settings, visibility_flags: int | None = None) -> Settings:
+    # Only column visibility differs per case: copy instead of re-validating
+    settings = base.model_copy(deep=True)
     if visibility_flags is None:
-        visibility_flags = pow(2, len(settings.table.columns.model_fields)) - 1
+        visibility_flags = _ALL_VISIBLE
     cols = settings.table.columns
     for i, col in enumerate(cols.model_fields):
         c = getattr(cols, col)
@@ -133,16 +139,18 @@ def _get_settings(visibility_flags: int | None = None) -> Settings:
     return settings
 
 
-def test_print_match_empty(capsys: CaptureFixture[str]) -> None:
-    output = Output(_get_settings())
+def test_print_match_empty(
+    capsys: CaptureFixture[str], base_settings: Settings
+) -> None:
+    output = Output(_get_settings(base_settings))
     output.print_match([])
     assert _strip_cap(capsys.readouterr()[0]) == Output.ERR_NO_MATCH
 
 
 def test_print_columns_empty(
-    capsys: CaptureFixture[str], players_output: list[Player]
+    capsys: CaptureFixture[str], base_settings: Settings, players_output: list[Player]
 ) -> None:
-    output = Output(_get_settings(0))
+    output = Output(_get_settings(base_settings, 0))
     output.print_match(players_output)
     assert not _strip_cap(capsys.readouterr()[0])
 
@@ -186,27 +194,44 @@ def test_visibility(out_v: Output, players_output: list[Player]) -> None:
     )
 
 
-@pytest.mark.parametrize('col_name', COLUMN_NAMES)
-def test_output_columns(
-    out: Output, players_output: list[Player], col_name: str
-) -> None:
+@pytest.fixture(scope='module')
+def match_and_rows(
+    out: Output, players_output: list[Player]
+) -> tuple[Match, list[list[Any]]]:
     match = Match(players_output)
-    rows_no_avg = deepcopy(out.table.rows)
+    rows_no_avg = list(out.table.rows)
     for i, party in enumerate(match.parties):
         if out.has_average_row(party):
             rows_no_avg.pop((i + 1) * party.size)
+    return match, rows_no_avg
+
 
+@pytest.fixture(scope='module')
+def column_validators(
+    match_and_rows: tuple[Match, list[list[Any]]],
+) -> list[dict[str, Callable[[Any], bool]]]:
+    match, _ = match_and_rows
+    return [
+        _column_validators(party, p) for party in match.parties for p in party.players
+    ]
+
+
+@pytest.mark.parametrize('col_name', COLUMN_NAMES)
+def test_output_columns(
+    out: Output,
+    match_and_rows: tuple[Match, list[list[Any]]],
+    column_validators: list[dict[str, Callable[[Any], bool]]],
+    col_name: str,
+) -> None:
+    _, rows_no_avg = match_and_rows
     cols = out.settings.table.columns
     col = getattr(cols, col_name)
     assertions = []
     if col.label in out.table.field_names:
+        col_index = out.get_column_index(col)
         assertions = [
-            _column_validators(match.parties[i // match.parties[0].size], p)[col_name](
-                rows_no_avg[i][out.get_column_index(col)]
-            )
-            for i, p in enumerate(
-                [*match.parties[0].players, *match.parties[1].players]
-            )
+            validators[col_name](rows_no_avg[i][col_index])
+            for i, validators in enumerate(column_validators)
         ]
     assert all(assertions)
 
@@ -214,7 +239,6 @@ def test_output_columns(
 def _column_validators(
     party: Party, player: Player
 ) -> dict[str, Callable[[Any], bool]]:
-    cols = Settings().table.columns
     rank_estimate = party.rank_estimates[player.relic_id]
     team = next(iter(party.pre_made_teams), None)
     team_rank = (
@@ -224,7 +248,7 @@ def _column_validators(
     )
     return dict(
         zip(
-            cols.model_fields.keys(),
+            COLUMN_NAMES,
             [
                 partial(operator.eq, player.faction),
                 partial(flip(operator.contains), rank_estimate[1]),
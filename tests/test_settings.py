@@ -36,29 +36,32 @@ def config_file() -> Generator[Path, Any, None]:
 
 
 @pytest.fixture(scope='module')
-def color_key() -> Key | None:
-    return _get_first_key_of_type(Settings(), Color)
+def type_keys(base_settings: Settings) -> dict[type, Key]:
+    keys: dict[type, Key] = {}
+    for cls, key in _iter_keys_by_type(base_settings):
+        keys.setdefault(cls, key)
+    return keys
 
 
 @pytest.fixture(scope='module')
-def path_key() -> Key | None:
-    return _get_first_key_of_type(Settings(), type(Path()))
+def color_key(type_keys: dict[type, Key]) -> Key | None:
+    return type_keys.get(Color)
 
 
-def _get_first_key_of_type(
-    model: BaseModel, cls: type, init_key: Key = ()
-) -> Key | None:
-    found_key = None
+@pytest.fixture(scope='module')
+def path_key(type_keys: dict[type, Key]) -> Key | None:
+    return type_keys.get(type(Path()))
+
+
+def _iter_keys_by_type(
+    model: BaseModel, init_key: Key = ()
+) -> Generator[tuple[type, Key], Any, None]:
+    # Depth-first in field order, so the first key per type matches a linear search
     for attr_name, field_info in model.model_fields.items():
-        if found_key is not None:
-            break
-        if type(field_info.default) is cls:
-            return *init_key, attr_name
+        key = (*init_key, attr_name)
+        yield type(field_info.default), key
         if isinstance(field_info.default, BaseModel):
-            found_key = _get_first_key_of_type(
-                getattr(model, attr_name), cls, (*init_key, attr_name)
-            )
-    return found_key
+            yield from _iter_keys_by_type(getattr(model, attr_name), key)
 
 
 def _get_model_value(model: BaseModel, key: Key) -> object:
@@ -68,9 +71,24 @@ def _get_model_value(model: BaseModel, key: Key) -> object:
     return val
 
 
+def _settings_with_override(key: Key, value: object) -> Settings:
+    values: Any = value
+    for k in reversed(key):
+        values = {k: values}
+    return Settings(**values)
+
+
 @pytest.mark.parametrize('color', list(Color))
-def test_valid_colors(config_file: Path, color_key: Key, color: Color) -> None:
+def test_valid_colors(color_key: Key, color: Color) -> None:
+    # Validation only: loading from TOML is covered by test_valid_color_config
+    if color_key is not None:
+        settings = _settings_with_override(color_key, color.name.capitalize())
+        assert _get_model_value(settings, color_key) == color
+
+
+def test_valid_color_config(config_file: Path, color_key: Key) -> None:
     if color_key is not None:
+        color = next(iter(Color))
         config_file.write_text(f"{'.'.join(color_key)} = '{color.name.capitalize()}'")
         settings = TomlSettings(config_file)
         assert _get_model_value(settings, color_key) == color
@@ -13,18 +13,15 @@
 #  You should have received a copy of the GNU General Public License along with
 #  CoH2LiveStats. If not, see <https://www.gnu.org/licenses/>.
 
+import sys
 from pathlib import Path
 from typing import get_args
 
 import pytest
+from _pytest.monkeypatch import MonkeyPatch
+from coh2_live_stats import util
 from coh2_live_stats.settings import Sound
-from coh2_live_stats.util import (
-    cls_name,
-    cls_name_parent,
-    play_sound,
-    ratio,
-    stop_sound,
-)
+from coh2_live_stats.util import cls_name, cls_name_parent, play_sound, ratio
 
 
 class A:
@@ -58,11 +55,19 @@ def test_ratio(x: float, total: float, expected: float | None) -> None:
 
 
 @pytest.mark.parametrize('s', get_args(Sound))
-def test_play_sound(s: Sound) -> None:
-    assert play_sound(
+def test_play_sound(monkeypatch: MonkeyPatch, s: Sound) -> None:
+    soundfile = (
         Path(__file__)
         .parents[1]
         .joinpath('src', 'coh2_live_stats', 'res', s)
         .with_suffix('.wav')
     )
-    stop_sound()
+    # Don't actually play anything: only check what is passed to the backend
+    played: list[str | None] = []
+    monkeypatch.setattr(
+        util, 'PlaySound', lambda sound, _: played.append(sound), raising=False
+    )
+    assert soundfile.is_file()
+    assert play_sound(soundfile)
+    if sys.platform == 'win32':
+        assert played[-1] == str(soundfile)